@@ -1,4 +1,3 @@
-import json
 import re
 
 VALID_RESOURCE_TYPES = {"pipelines", "datasets", "linked_services", "triggers", "integration_runtimes"}
@@ -119,15 +118,3 @@ def validate_rules_config(config: dict) -> list:
 
     return errors
 
-
-if __name__ == "__main__":
-    with open("rules_config.json", "r", encoding="utf-8") as f:
-        rules_config = json.load(f)
-
-    errors = validate_rules_config(rules_config)
-    if errors:
-        print("❌ Config validation failed:")
-        for e in errors:
-            print(" -", e)
-    else:
-        print("✅ Config file is valid")
@@ -0,0 +1,34 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # optional: pip install factorylint[fast]
+    orjson = None
+
+
+def loads(text: str):
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    orjson is stricter than the stdlib parser (it rejects NaN/Infinity and
+    integers beyond 64 bits), so anything it refuses is re-parsed with json
+    and the result never depends on whether orjson is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def load_file(path) -> dict:
+    """
+    Read and parse a JSON file (UTF-8 enforced).
+
+    Raises UnicodeDecodeError for non UTF-8 content and a ValueError
+    subclass for malformed JSON, whichever parser is in use.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    return loads(data.decode("utf-8"))
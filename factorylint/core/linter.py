@@ -1,5 +1,8 @@
 from enum import Enum
+from itertools import combinations
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+from . import jsonio
 from .validators import (
     DatasetValidator,
     PipelineValidator,
@@ -16,6 +19,40 @@ class ADFResourceType(Enum):
     UNKNOWN = "Unknown"
 
 
+# Last segment of the ARM resource type (lower-cased) -> resource type
+_TYPE_SUFFIX_MAP = {
+    "pipelines": ADFResourceType.PIPELINE,
+    "datasets": ADFResourceType.DATASET,
+    "linkedservices": ADFResourceType.LINKED_SERVICE,
+    "triggers": ADFResourceType.TRIGGER,
+}
+
+
+# Structural detection from "properties" keys, in precedence order
+_STRUCTURAL_RULES = (
+    (frozenset({"activities"}), ADFResourceType.PIPELINE),
+    (frozenset({"typeProperties", "linkedServiceName"}), ADFResourceType.DATASET),
+    (frozenset({"connectVia", "type"}), ADFResourceType.LINKED_SERVICE),
+    (frozenset({"pipelines", "type"}), ADFResourceType.TRIGGER),
+)
+_PROBE_KEYS = frozenset().union(*(keys for keys, _ in _STRUCTURAL_RULES))
+
+
+def _match_structural_rules(present: frozenset) -> ADFResourceType:
+    for keys, resource_type in _STRUCTURAL_RULES:
+        if keys <= present:
+            return resource_type
+    return ADFResourceType.UNKNOWN
+
+
+# Every subset of the probe keys resolved up front, so detection is a single hash lookup
+_STRUCTURAL_DISPATCH = {
+    frozenset(subset): _match_structural_rules(frozenset(subset))
+    for size in range(len(_PROBE_KEYS) + 1)
+    for subset in combinations(_PROBE_KEYS, size)
+}
+
+
 def identify_adf_resource(resource_json: dict) -> ADFResourceType:
     """
     Identify the type of Azure Data Factory resource from its JSON.
@@ -23,56 +60,107 @@ def identify_adf_resource(resource_json: dict) -> ADFResourceType:
 
     top_type = resource_json.get("type", "").lower()
 
-    if top_type.endswith("/pipelines"):
-        return ADFResourceType.PIPELINE
-    if top_type.endswith("/datasets"):
-        return ADFResourceType.DATASET
-    if top_type.endswith("/linkedservices"):
-        return ADFResourceType.LINKED_SERVICE
-    if top_type.endswith("/triggers"):
-        return ADFResourceType.TRIGGER
+    _, sep, suffix = top_type.rpartition("/")
+    if sep:
+        resource_type = _TYPE_SUFFIX_MAP.get(suffix)
+        if resource_type is not None:
+            return resource_type
 
     props = resource_json.get("properties", {})
 
-    if "activities" in props:
-        return ADFResourceType.PIPELINE
-    if "typeProperties" in props and "linkedServiceName" in props:
-        return ADFResourceType.DATASET
-    if "connectVia" in props and "type" in props:
-        return ADFResourceType.LINKED_SERVICE
-    if "pipelines" in props and "type" in props:
-        return ADFResourceType.TRIGGER
+    return _STRUCTURAL_DISPATCH[_PROBE_KEYS.intersection(props)]
 
-    return ADFResourceType.UNKNOWN
+
+_VALIDATOR_CLASSES = {
+    ADFResourceType.PIPELINE: PipelineValidator,
+    ADFResourceType.DATASET: DatasetValidator,
+    ADFResourceType.LINKED_SERVICE: LinkedServiceValidator,
+    ADFResourceType.TRIGGER: TriggerValidator,
+}
 
 
 def lint_resource(
     resource_path: str,
     resource_type: ADFResourceType,
     rules: dict,
+    validators: Optional[dict] = None,
+    resource_json: Optional[dict] = None,
 ) -> list[str]:
     """
-    Lint a single ADF resource using provided rules
+    Lint a single ADF resource using provided rules.
+
+    Validators compile their patterns and lookup sets on construction. Pass
+    the same ``validators`` dict for every resource linted with ``rules`` to
+    build each validator once and reuse it. Pass ``resource_json`` when the
+    file has already been parsed (e.g. for identify_adf_resource) so it is
+    not read again.
     """
 
     resource_path = Path(resource_path)
 
-    match resource_type:
-        case ADFResourceType.PIPELINE:
-            validator = PipelineValidator(rules)
-            return validator.validate(str(resource_path))
+    if validators is None:
+        validators = {}
 
-        case ADFResourceType.DATASET:
-            validator = DatasetValidator(rules)
-            return validator.validate(str(resource_path))
+    validator = validators.get(resource_type)
 
-        case ADFResourceType.LINKED_SERVICE:
-            validator = LinkedServiceValidator(rules)
-            return validator.validate(str(resource_path))
+    if validator is None:
+        validator_cls = _VALIDATOR_CLASSES.get(resource_type)
+        if validator_cls is None:
+            return [f"Unknown resource type for {resource_path.name}"]
 
-        case ADFResourceType.TRIGGER:
-            validator = TriggerValidator(rules)
-            return validator.validate(str(resource_path))
+        validator = validators[resource_type] = validator_cls(rules)
 
-        case _:
-            return [f"Unknown resource type for {resource_path.name}"]
+    return validator.validate(str(resource_path), resource_json)
+
+
+def lint_file(
+    resource_path: str,
+    rules: dict,
+    validators: Optional[dict] = None,
+) -> Tuple[Optional[ADFResourceType], List[str], List[str], Optional[str]]:
+    """
+    Parse, identify and lint a single JSON resource file.
+
+    Returns (resource_type, errors, skipped, parse_error). When the file
+    can't be read or parsed, resource_type is None and parse_error holds
+    the message; unrecognised resources are returned as
+    ADFResourceType.UNKNOWN with no errors.
+    """
+
+    try:
+        resource_json = jsonio.load_file(resource_path)
+    except Exception as e:
+        return None, [], [], str(e)
+
+    resource_type = identify_adf_resource(resource_json)
+
+    if resource_type == ADFResourceType.UNKNOWN:
+        return resource_type, [], [], None
+
+    errors, skipped = lint_resource(
+        resource_path=str(resource_path),
+        resource_type=resource_type,
+        rules=rules,
+        validators=validators,
+        resource_json=resource_json,
+    )
+    return resource_type, errors, skipped, None
+
+
+def lint_resources(
+    resource_paths: Iterable[str],
+    rules: dict,
+) -> Iterator[Tuple[str, Optional[ADFResourceType], List[str], List[str], Optional[str]]]:
+    """
+    Identify and lint a batch of JSON resource files.
+
+    All files share one set of validators, so patterns and lookup sets are
+    built once for the whole batch. Yields (resource_path, resource_type,
+    errors, skipped, parse_error) in input order; see lint_file. A file
+    that fails to parse does not stop the batch.
+    """
+
+    validators: dict = {}
+
+    for resource_path in resource_paths:
+        yield (resource_path, *lint_file(resource_path, rules, validators))
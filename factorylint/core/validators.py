@@ -1,8 +1,68 @@
-import yaml
 import json
 import re
+import sys
+import functools
+from factorylint.core import jsonio
 from factorylint.core.resources import ResourceType
-from typing import Tuple, List
+from typing import Collection, Tuple, List, Optional
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a configured naming/annotation pattern.
+
+    Every config regex goes through here, so patterns are compiled once per
+    process and the engine (stdlib re, Python syntax) is chosen in one place.
+    """
+    return re.compile(pattern)
+
+
+def _token_set(values) -> Collection:
+    """
+    Build a membership set from configured tokens (abbreviations, formats, ...).
+
+    String tokens are interned, so the sets built by every validator share
+    one string object per distinct token. This only saves memory: lookups
+    still hash and compare the name segment, and the config lists used in
+    error messages keep their own copies. A key left empty in YAML loads as
+    None and yields an empty set, i.e. the check is skipped. Unhashable
+    entries (e.g. a nested list) fall back to a tuple, so they are reported
+    as ordinary lint errors instead of failing validator construction.
+    """
+    if values is None:
+        return frozenset()
+    try:
+        return frozenset(sys.intern(v) if isinstance(v, str) else v for v in values)
+    except TypeError:
+        return tuple(values)
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix_index(prefixes: Tuple[str, ...]) -> Tuple[Tuple[int, ...], frozenset]:
+    """
+    Index a set of literal prefixes by length for _match_prefix.
+
+    Lengths are ordered longest-first so that overlapping prefixes
+    (e.g. "env:" and "env:prod:") resolve to the most specific one.
+    """
+    lengths = tuple(sorted({len(p) for p in prefixes}, reverse=True))
+    return lengths, frozenset(prefixes)
+
+
+def _match_prefix(value: str, index: Tuple[Tuple[int, ...], frozenset]) -> Optional[str]:
+    """
+    Return the longest indexed prefix of value, or None.
+
+    Costs one slice and hash lookup per distinct prefix length, independent
+    of how many prefixes are configured.
+    """
+    lengths, prefixes = index
+    for length in lengths:
+        head = value[:length]
+        if head in prefixes:
+            return head
+    return None
 
 
 def _validate_annotations(annotations: List[str], rules: dict) -> List[str]:
@@ -30,16 +90,14 @@ def _validate_annotations(annotations: List[str], rules: dict) -> List[str]:
     # Build a map of prefix -> list of matching annotations for quick lookup
     known_prefixes = {cfg["prefix"]: cat_name for cat_name, cfg in categories.items() if "prefix" in cfg}
     prefix_to_annotations: dict[str, List[str]] = {p: [] for p in known_prefixes}
+    prefix_index = _prefix_index(tuple(known_prefixes))
     unknown: List[str] = []
 
     for annotation in annotations:
-        matched = False
-        for prefix in known_prefixes:
-            if annotation.startswith(prefix):
-                prefix_to_annotations[prefix].append(annotation)
-                matched = True
-                break
-        if not matched:
+        prefix = _match_prefix(annotation, prefix_index)
+        if prefix is not None:
+            prefix_to_annotations[prefix].append(annotation)
+        else:
             unknown.append(annotation)
 
     if unknown:
@@ -51,6 +109,7 @@ def _validate_annotations(annotations: List[str], rules: dict) -> List[str]:
         required = cat_cfg.get("required", False)
         allowed_values = cat_cfg.get("allowed_values", [])
         pattern = cat_cfg.get("pattern")
+        pattern_re = _compile_pattern(pattern) if pattern else None
 
         matches = prefix_to_annotations.get(prefix, [])
 
@@ -72,7 +131,7 @@ def _validate_annotations(annotations: List[str], rules: dict) -> List[str]:
                     f"Annotation '{annotation}' is not an allowed value for category '{cat_name}'. "
                     f"Allowed: {allowed_values}"
                 )
-            if pattern and not re.match(pattern, annotation):
+            if pattern_re and not pattern_re.match(annotation):
                 errors.append(
                     f"Annotation '{annotation}' does not match pattern '{pattern}' for category '{cat_name}'"
                 )
@@ -80,21 +139,41 @@ def _validate_annotations(annotations: List[str], rules: dict) -> List[str]:
     return errors
 
 
+@functools.lru_cache(maxsize=4096)
+def _name_errors(
+    name: str,
+    entity_type: str,
+    pattern_re: Optional["re.Pattern[str]"],
+    case: str,
+    prefix: str,
+) -> Tuple[str, ...]:
+    """
+    Check a single name against a flat naming config.
+
+    Parameter and variable names repeat across most pipelines of a factory,
+    so results are memoized; a tuple is returned so cached values can't be mutated.
+    """
+    errors = []
+    if pattern_re and not pattern_re.match(name):
+        errors.append(f"{entity_type} '{name}' does not match pattern '{pattern_re.pattern}'")
+    if case == "upper" and name != name.upper():
+        errors.append(f"{entity_type} '{name}' must be uppercase")
+    elif case == "lower" and name != name.lower():
+        errors.append(f"{entity_type} '{name}' must be lowercase")
+    if prefix and not name.startswith(prefix):
+        errors.append(f"{entity_type} '{name}' must start with prefix '{prefix}'")
+    return tuple(errors)
+
+
 def _validate_names(names: List[str], naming: dict, entity_type: str) -> List[str]:
     """Validate a list of names against a flat naming config (pattern, case, prefix)."""
     errors = []
     pattern = naming.get("pattern")
+    pattern_re = _compile_pattern(pattern) if pattern else None
     case = naming.get("case")
     prefix = naming.get("prefix")
     for name in names:
-        if pattern and not re.match(pattern, name):
-            errors.append(f"{entity_type} '{name}' does not match pattern '{pattern}'")
-        if case == "upper" and name != name.upper():
-            errors.append(f"{entity_type} '{name}' must be uppercase")
-        elif case == "lower" and name != name.lower():
-            errors.append(f"{entity_type} '{name}' must be lowercase")
-        if prefix and not name.startswith(prefix):
-            errors.append(f"{entity_type} '{name}' must start with prefix '{prefix}'")
+        errors.extend(_name_errors(name, entity_type, pattern_re, case, prefix))
     return errors
 
 
@@ -107,6 +186,15 @@ class BaseValidator:
     def __init__(self, resource_type: ResourceType, rules: dict):
         self.rules = rules['resources'][resource_type.value]
 
+    def _compile_naming(self) -> None:
+        """
+        Build the compiled naming state (patterns, lookup sets) from self.naming.
+
+        Subclasses call this from __init__ only when the resource is enabled;
+        disabled resources are never validated, so an invalid or malformed
+        naming config for them is ignored rather than raising.
+        """
+
     def get_all_rules(self) -> dict:
         """Return rules as formatted JSON string"""
         return json.dumps(self.rules, indent=4)
@@ -114,13 +202,16 @@ class BaseValidator:
     def load_resource(self, resource_path: str) -> dict:
         """Load resource from a YAML or JSON file (UTF-8 enforced)"""
         try:
-            with open(resource_path, "r", encoding="utf-8") as file:
-                if resource_path.endswith((".yaml", ".yml")):
+            if resource_path.endswith(".json"):
+                return jsonio.load_file(resource_path)
+            elif resource_path.endswith((".yaml", ".yml")):
+                # Deferred: ADF exports are JSON, so importing the core modules shouldn't pay for PyYAML
+                import yaml
+
+                with open(resource_path, "r", encoding="utf-8") as file:
                     return yaml.safe_load(file)
-                elif resource_path.endswith(".json"):
-                    return json.load(file)
-                else:
-                    raise ValueError(f"Unsupported file format: {resource_path}")
+            else:
+                raise ValueError(f"Unsupported file format: {resource_path}")
         except UnicodeDecodeError as e:
             raise ValueError(
                 f"File is not valid UTF-8: {resource_path}"
@@ -139,15 +230,27 @@ class DatasetValidator(BaseValidator):
         self.enabled = self.rules.get("enabled", True)
         self.description = self.rules.get("description", "")
         self.param_rules = rules.get("parameters", {})
+        if self.enabled:
+            self._compile_naming()
 
-    def validate(self, dataset_file_path: str) -> Tuple[List[str], List[str]]:
+    def _compile_naming(self) -> None:
+        pattern = self.naming.get("pattern")
+        self.pattern_re = _compile_pattern(pattern) if pattern else None
+        self.separator = self.naming.get("separator")
+        self.min_parts = self.naming.get("min_separated_parts", 0)
+        self.max_parts = self.naming.get("max_separated_parts", float("inf"))
+        # Membership sets for the per-segment checks; the config lists are kept for error messages
+        self.allowed_formats = _token_set(self.naming.get("allowed_formats", []))
+        self.allowed_sources = _token_set((self.naming.get("allowed_source_abbreviations") or {}).values())
+
+    def validate(self, dataset_file_path: str, resource: Optional[dict] = None) -> Tuple[List[str], List[str]]:
         errors = []
         skipped = []
 
         if not self.enabled:
             return errors, skipped
 
-        dataset = self.load_resource(dataset_file_path)
+        dataset = resource if resource is not None else self.load_resource(dataset_file_path)
         name = dataset.get("name", "")
 
         # -----------------------
@@ -161,9 +264,8 @@ class DatasetValidator(BaseValidator):
         # -----------------------
         # Check pattern
         # -----------------------
-        pattern = self.naming.get("pattern")
-        if pattern and not re.match(pattern, name):
-            errors.append(f"Dataset '{name}' does not match pattern '{pattern}'")
+        if self.pattern_re and not self.pattern_re.match(name):
+            errors.append(f"Dataset '{name}' does not match pattern '{self.pattern_re.pattern}'")
 
         # -----------------------
         # Check case
@@ -184,45 +286,36 @@ class DatasetValidator(BaseValidator):
         # -----------------------
         # Check allowed formats
         # -----------------------
-        allowed_formats = self.naming.get("allowed_formats", [])
-
-        if allowed_formats:
-            sep = self.naming.get("separator", "_")
-            parts = name.split(sep)
-            if len(parts) == 0:
-                errors.append(f"Dataset '{name}' has no format part")
-            else:
-                format_part = parts[-1]
+        if self.allowed_formats:
+            # Only the last segment is needed, so avoid building the full split list
+            format_part = name.rpartition(self.separator or "_")[2]
 
-                if format_part not in allowed_formats:
-                    errors.append(
-                        f"Dataset '{name}' has invalid format '{format_part}'. "
-                        f"Allowed formats: {allowed_formats}"
-                    )
+            if format_part not in self.allowed_formats:
+                errors.append(
+                    f"Dataset '{name}' has invalid format '{format_part}'. "
+                    f"Allowed formats: {self.naming['allowed_formats']}"
+                )
 
         # -----------------------
         # Split by separator to check min/max parts
         # -----------------------
-        sep = self.naming.get("separator")
+        sep = self.separator
         if sep:
             parts = name.split(sep)
-            min_parts = self.naming.get("min_separated_parts", 0)
-            max_parts = self.naming.get("max_separated_parts", float("inf"))
-            if len(parts) < min_parts or len(parts) > max_parts:
+            if len(parts) < self.min_parts or len(parts) > self.max_parts:
                 errors.append(
-                    f"Dataset '{name}' should have between {min_parts} and {max_parts} parts separated by '{sep}'"
+                    f"Dataset '{name}' should have between {self.min_parts} and {self.max_parts} parts separated by '{sep}'"
                 )
 
             # -----------------------
             # Check allowed sources
             # -----------------------
-            allowed_sources = self.naming.get("allowed_source_abbreviations", {})
             source_pos = self.naming.get("required_source_position", 2) - 1
-            if allowed_sources and len(parts) > source_pos:
-                if parts[source_pos] not in allowed_sources.values():
+            if self.allowed_sources and len(parts) > source_pos:
+                if parts[source_pos] not in self.allowed_sources:
                     errors.append(
                         f"Dataset '{name}' has invalid source abbreviation '{parts[source_pos]}'. "
-                        f"Allowed: {list(allowed_sources.values())}"
+                        f"Allowed: {list(self.naming['allowed_source_abbreviations'].values())}"
                     )
 
         # -----------------------
@@ -248,8 +341,17 @@ class PipelineValidator(BaseValidator):
         self.param_rules = rules.get("parameters", {})
         self.var_rules = rules.get("variables", {})
         self.annotation_rules = rules.get("annotations", {})
+        if self.enabled:
+            self._compile_naming()
 
-    def validate(self, pipeline_file_path: str) -> Tuple[List[str], List[str]]:
+    def _compile_naming(self) -> None:
+        pattern = self.naming.get("pattern")
+        self.pattern_re = _compile_pattern(pattern) if pattern else None
+        self.separator = self.naming.get("separator", "_")
+        self.min_parts = self.naming.get("min_separated_parts", 0)
+        self.max_parts = self.naming.get("max_separated_parts", float("inf"))
+
+    def validate(self, pipeline_file_path: str, resource: Optional[dict] = None) -> Tuple[List[str], List[str]]:
 
         errors = []
         skipped = []
@@ -257,7 +359,7 @@ class PipelineValidator(BaseValidator):
         if not self.enabled:
             return errors, skipped
 
-        pipeline = self.load_resource(pipeline_file_path)
+        pipeline = resource if resource is not None else self.load_resource(pipeline_file_path)
         name = pipeline.get("name", "")
 
         # -----------------------
@@ -280,9 +382,8 @@ class PipelineValidator(BaseValidator):
         # -----------------------
         # Pattern
         # -----------------------
-        pattern = self.naming.get("pattern")
-        if pattern and not re.match(pattern, name):
-            errors.append(f"Pipeline '{name}' does not match pattern '{pattern}'")
+        if self.pattern_re and not self.pattern_re.match(name):
+            errors.append(f"Pipeline '{name}' does not match pattern '{self.pattern_re.pattern}'")
 
         # -----------------------
         # Case
@@ -303,13 +404,11 @@ class PipelineValidator(BaseValidator):
         # -----------------------
         # Separator / parts count
         # -----------------------
-        sep = self.naming.get("separator", "_")
+        sep = self.separator
         parts = name.split(sep)
-        min_parts = self.naming.get("min_separated_parts", 0)
-        max_parts = self.naming.get("max_separated_parts", float("inf"))
-        if not (min_parts <= len(parts) <= max_parts):
+        if not (self.min_parts <= len(parts) <= self.max_parts):
             errors.append(
-                f"Pipeline '{name}' must have between {min_parts} and {max_parts} parts separated by '{sep}'"
+                f"Pipeline '{name}' must have between {self.min_parts} and {self.max_parts} parts separated by '{sep}'"
             )
 
         # -----------------------
@@ -359,8 +458,18 @@ class LinkedServiceValidator(BaseValidator):
         super().__init__(ResourceType.LINKED_SERVICE, rules)
         self.naming = self.rules.get("naming", {})
         self.enabled = self.rules.get("enabled", True)
+        if self.enabled:
+            self._compile_naming()
 
-    def validate(self, linked_service_file_path: str) -> Tuple[List[str], List[str]]:
+    def _compile_naming(self) -> None:
+        pattern = self.naming.get("pattern")
+        self.pattern_re = _compile_pattern(pattern) if pattern else None
+        self.separator = self.naming.get("separator", "_")
+        self.min_parts = self.naming.get("min_separated_parts", 0)
+        self.max_parts = self.naming.get("max_separated_parts", float("inf"))
+        self.allowed_abbreviations = _token_set(self.naming.get("allowed_abbreviations", []))
+
+    def validate(self, linked_service_file_path: str, resource: Optional[dict] = None) -> Tuple[List[str], List[str]]:
 
         errors = []
         skipped = []
@@ -368,7 +477,7 @@ class LinkedServiceValidator(BaseValidator):
         if not self.enabled:
             return errors, skipped
     
-        linked_service = self.load_resource(linked_service_file_path)
+        linked_service = resource if resource is not None else self.load_resource(linked_service_file_path)
         name = linked_service.get("name", "")
 
         if not name:
@@ -401,36 +510,31 @@ class LinkedServiceValidator(BaseValidator):
         # -----------------------
         # Pattern
         # -----------------------
-        pattern = self.naming.get("pattern")
-        if pattern and not re.match(pattern, name):
+        if self.pattern_re and not self.pattern_re.match(name):
             errors.append(
-                f"Linked Service '{name}' does not match pattern '{pattern}'"
+                f"Linked Service '{name}' does not match pattern '{self.pattern_re.pattern}'"
             )
 
         # -----------------------
         # Split checks
         # -----------------------
-        sep = self.naming.get("separator", "_")
+        sep = self.separator
         parts = name.split(sep)
 
-        min_parts = self.naming.get("min_separated_parts", 0)
-        max_parts = self.naming.get("max_separated_parts", float("inf"))
-
-        if not (min_parts <= len(parts) <= max_parts):
+        if not (self.min_parts <= len(parts) <= self.max_parts):
             errors.append(
-                f"Linked Service '{name}' must have between {min_parts} and {max_parts} parts separated by '{sep}'"
+                f"Linked Service '{name}' must have between {self.min_parts} and {self.max_parts} parts separated by '{sep}'"
             )
 
         # -----------------------
         # Allowed abbreviations
         # -----------------------
-        allowed_abbr = self.naming.get("allowed_abbreviations", [])
-        if allowed_abbr and len(parts) > 1:
+        if self.allowed_abbreviations and len(parts) > 1:
             abbr = parts[1]
-            if abbr not in allowed_abbr:
+            if abbr not in self.allowed_abbreviations:
                 errors.append(
                     f"Linked Service '{name}' has invalid abbreviation '{abbr}'. "
-                    f"Allowed: {allowed_abbr}"
+                    f"Allowed: {self.naming['allowed_abbreviations']}"
                 )
 
         return errors, skipped
@@ -447,15 +551,27 @@ class TriggerValidator(BaseValidator):
         self.naming = self.rules.get("naming", {})
         self.enabled = self.rules.get("enabled", True)
         self.annotation_rules = rules.get("annotations", {})
+        if self.enabled:
+            self._compile_naming()
 
-    def validate(self, trigger_file_path: str) -> Tuple[List[str], List[str]]:
+    def _compile_naming(self) -> None:
+        pattern = self.naming.get("pattern")
+        self.pattern_re = _compile_pattern(pattern) if pattern else None
+        self.separator = self.naming.get("separator", "_")
+        self.min_parts = self.naming.get("min_separated_parts", 0)
+        self.max_parts = self.naming.get("max_separated_parts", float("inf"))
+        # Membership sets for the split-part checks; the lists are kept for error messages
+        self.allowed_types = _token_set(self.naming.get("allowed_types", []))
+        self.allowed_frequencies = _token_set(self.naming.get("allowed_frequencies", []))
+
+    def validate(self, trigger_file_path: str, resource: Optional[dict] = None) -> Tuple[List[str], List[str]]:
         errors = []
         skipped = []
 
         if not self.enabled:
             return errors, skipped
 
-        trigger = self.load_resource(trigger_file_path)
+        trigger = resource if resource is not None else self.load_resource(trigger_file_path)
         name = trigger.get("name", "")
 
         if not name:
@@ -487,43 +603,38 @@ class TriggerValidator(BaseValidator):
         # -----------------------
         # Pattern
         # -----------------------
-        pattern = self.naming.get("pattern")
-        if pattern and not re.match(pattern, name):
-            errors.append(f"Trigger '{name}' does not match pattern '{pattern}'")
+        if self.pattern_re and not self.pattern_re.match(name):
+            errors.append(f"Trigger '{name}' does not match pattern '{self.pattern_re.pattern}'")
 
         # -----------------------
         # Split checks
         # -----------------------
-        sep = self.naming.get("separator", "_")
+        sep = self.separator
         parts = name.split(sep)
 
-        min_parts = self.naming.get("min_separated_parts", 0)
-        max_parts = self.naming.get("max_separated_parts", float("inf"))
-        if not (min_parts <= len(parts) <= max_parts):
+        if not (self.min_parts <= len(parts) <= self.max_parts):
             errors.append(
-                f"Trigger '{name}' must have between {min_parts} and {max_parts} parts separated by '{sep}'"
+                f"Trigger '{name}' must have between {self.min_parts} and {self.max_parts} parts separated by '{sep}'"
             )
 
         # -----------------------
         # Allowed trigger types
         # -----------------------
-        allowed_types = self.naming.get("allowed_types", [])
-        if allowed_types and len(parts) > 1:
-            if parts[1] not in allowed_types:
+        if self.allowed_types and len(parts) > 1:
+            if parts[1] not in self.allowed_types:
                 errors.append(
                     f"Trigger '{name}' has invalid type '{parts[1]}'. "
-                    f"Allowed: {allowed_types}"
+                    f"Allowed: {self.naming['allowed_types']}"
                 )
 
         # -----------------------
         # Allowed frequencies
         # -----------------------
-        allowed_frequencies = self.naming.get("allowed_frequencies", [])
-        if allowed_frequencies and len(parts) > 2:
-            if parts[2] not in allowed_frequencies:
+        if self.allowed_frequencies and len(parts) > 2:
+            if parts[2] not in self.allowed_frequencies:
                 errors.append(
                     f"Trigger '{name}' has invalid frequency '{parts[2]}'. "
-                    f"Allowed: {allowed_frequencies}"
+                    f"Allowed: {self.naming['allowed_frequencies']}"
                 )
 
         # -----------------------
@@ -8,7 +8,7 @@ import yaml
 from click.testing import CliRunner
 from pathlib import Path
 
-from factorylint.cli import cli, load_config
+from factorylint.cli import cli, load_config, _iter_json_files
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +124,32 @@ class TestLoadConfig:
             load_config(str(p))
 
 
+# ============================================================
+# _iter_json_files
+# ============================================================
+
+class TestIterJsonFiles:
+
+    def test_finds_nested_json_files_only(self, tmp_path):
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "sub" / "deeper" / "b.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "sub" / "notes.txt").write_text("", encoding="utf-8")
+        (tmp_path / "dir.json").mkdir()
+        found = sorted(p.relative_to(tmp_path) for p in _iter_json_files(str(tmp_path)))
+        assert found == [Path("a.json"), Path("sub/deeper/b.json")]
+
+    def test_symlink_loop_is_not_followed(self, tmp_path):
+        (tmp_path / "pipeline" / "sub").mkdir(parents=True)
+        (tmp_path / "pipeline" / "a.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "pipeline" / "sub" / "loop").symlink_to("..", target_is_directory=True)
+        found = list(_iter_json_files(str(tmp_path / "pipeline")))
+        assert found == [tmp_path / "pipeline" / "a.json"]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        assert list(_iter_json_files(str(tmp_path / "missing"))) == []
+
+
 # ============================================================
 # init command
 # ============================================================
@@ -151,6 +177,33 @@ class TestInitCommand:
             assert result.exit_code == 0
 
 
+# ============================================================
+# check-config command
+# ============================================================
+
+class TestCheckConfigCommand:
+
+    def test_valid_config_exits_0(self, tmp_path):
+        config_path = _write_config(tmp_path)
+        result = CliRunner().invoke(cli, ["check-config", "--config", str(config_path)])
+        assert result.exit_code == 0
+        assert "Config file is valid" in result.output
+
+    def test_invalid_config_reports_errors(self, tmp_path):
+        config = _minimal_rules_config()
+        config["annotations"] = {"enabled": "yes"}
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        result = CliRunner().invoke(cli, ["check-config", "--config", str(config_path)])
+        assert result.exit_code == 1
+        assert "annotations.enabled must be a boolean" in result.output
+
+    def test_missing_config_exits_1(self, tmp_path):
+        result = CliRunner().invoke(cli, ["check-config", "--config", str(tmp_path / "missing.yml")])
+        assert result.exit_code == 1
+        assert "Config not found" in result.output
+
+
 # ============================================================
 # lint command
 # ============================================================
@@ -322,6 +375,56 @@ class TestLintCommand:
                 ],
             )
             assert result.exit_code == 1
+            # Buffered report lines must be flushed before the early exit
+            assert "does not match pattern" in result.output
+            assert "Summary" not in result.output
+
+    # --- Parallel workers ---
+
+    def test_lint_with_jobs_matches_sequential_results(self, tmp_path):
+        config_path = _write_config(tmp_path)
+        resources_path = tmp_path / "resources"
+        _write_pipeline(resources_path, name="PL_MES_ORDERS_INGEST")
+        _write_pipeline(resources_path, name="PL_MES_ITEMS_LOAD")
+        _write_pipeline(resources_path, name="bad_pipeline_name")
+        runner = CliRunner()
+        outputs = []
+        for jobs in ("1", "2"):
+            with runner.isolated_filesystem(temp_dir=tmp_path):
+                result = runner.invoke(
+                    cli,
+                    [
+                        "lint",
+                        "--config", str(config_path),
+                        "--resources", str(resources_path),
+                        "--jobs", jobs,
+                    ],
+                )
+                assert result.exit_code == 1
+                with open(".adf-linter/linter_results.json", encoding="utf-8") as f:
+                    outputs.append((result.output, json.load(f)))
+        assert outputs[0] == outputs[1]
+        assert list(outputs[1][1]) == [str(Path("pipeline") / "bad_pipeline_name.json")]
+
+    def test_lint_fail_fast_with_jobs_exits_1(self, tmp_path):
+        config_path = _write_config(tmp_path)
+        resources_path = tmp_path / "resources"
+        _write_pipeline(resources_path, name="bad_name_one")
+        _write_pipeline(resources_path, name="bad_name_two")
+        runner = CliRunner()
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            result = runner.invoke(
+                cli,
+                [
+                    "lint",
+                    "--config", str(config_path),
+                    "--resources", str(resources_path),
+                    "--fail-fast",
+                    "--jobs", "2",
+                ],
+            )
+            assert result.exit_code == 1
+            assert result.exception is None or isinstance(result.exception, SystemExit)
 
     # --- Summary output ---
 
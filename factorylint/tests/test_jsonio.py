@@ -0,0 +1,48 @@
+"""
+Tests for factorylint.core.jsonio
+"""
+import json
+import pytest
+
+from factorylint.core import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def parser(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if jsonio.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+def test_load_file_parses_json(tmp_path, parser):
+    p = tmp_path / "resource.json"
+    p.write_text(json.dumps({"name": "PL_ÄÖÜ", "properties": {"activities": []}}), encoding="utf-8")
+    assert jsonio.load_file(p) == {"name": "PL_ÄÖÜ", "properties": {"activities": []}}
+
+
+def test_load_file_rejects_non_utf8(tmp_path, parser):
+    p = tmp_path / "latin1.json"
+    p.write_bytes('{"name": "PL_ÄÖÜ"}'.encode("latin-1"))
+    with pytest.raises(UnicodeDecodeError):
+        jsonio.load_file(p)
+
+
+def test_load_file_malformed_json_raises_value_error(tmp_path, parser):
+    p = tmp_path / "bad.json"
+    p.write_text("{not valid json", encoding="utf-8")
+    with pytest.raises(ValueError):
+        jsonio.load_file(p)
+
+
+def test_load_file_accepts_documents_only_stdlib_parses(tmp_path, parser):
+    # NaN and integers beyond 64 bits are rejected by orjson but valid for json
+    p = tmp_path / "lenient.json"
+    p.write_text('{"name": "DS_X", "limit": NaN, "id": 123456789012345678901234567890}', encoding="utf-8")
+    data = jsonio.load_file(p)
+    assert data["name"] == "DS_X"
+    assert data["id"] == 123456789012345678901234567890
+    assert data["limit"] != data["limit"]
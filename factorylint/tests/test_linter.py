@@ -4,7 +4,7 @@ Tests for factorylint.core.linter
 import json
 import pytest
 
-from factorylint.core.linter import identify_adf_resource, lint_resource, ADFResourceType
+from factorylint.core.linter import identify_adf_resource, lint_resource, lint_resources, ADFResourceType
 
 
 # ---------------------------------------------------------------------------
@@ -37,6 +37,11 @@ def test_type_field_case_insensitive():
     assert identify_adf_resource(resource) == ADFResourceType.PIPELINE
 
 
+def test_type_field_requires_path_separator():
+    # A bare collection name is not an ARM resource type
+    assert identify_adf_resource({"type": "pipelines"}) == ADFResourceType.UNKNOWN
+
+
 # ---------------------------------------------------------------------------
 # identify_adf_resource – properties-based detection (no type field)
 # ---------------------------------------------------------------------------
@@ -76,6 +81,20 @@ def test_identify_trigger_by_properties():
     assert identify_adf_resource(resource) == ADFResourceType.TRIGGER
 
 
+def test_properties_detection_keeps_precedence_order():
+    # Pipelines win over datasets, linked services over triggers
+    resource = {"properties": {"activities": [], "typeProperties": {}, "linkedServiceName": {}}}
+    assert identify_adf_resource(resource) == ADFResourceType.PIPELINE
+    resource = {"properties": {"connectVia": {}, "pipelines": [], "type": "X"}}
+    assert identify_adf_resource(resource) == ADFResourceType.LINKED_SERVICE
+
+
+def test_properties_detection_ignores_unrelated_keys():
+    resource = {"properties": {"description": "d", "annotations": [], "activities": []}}
+    assert identify_adf_resource(resource) == ADFResourceType.PIPELINE
+    assert identify_adf_resource({"properties": {"type": "X"}}) == ADFResourceType.UNKNOWN
+
+
 def test_identify_unknown_when_no_clues():
     assert identify_adf_resource({}) == ADFResourceType.UNKNOWN
     assert identify_adf_resource({"properties": {}}) == ADFResourceType.UNKNOWN
@@ -197,3 +216,51 @@ def test_lint_resource_valid_trigger_no_errors(tmp_path):
     f.write_text(json.dumps(resource), encoding="utf-8")
     errors, skipped = lint_resource(str(f), ADFResourceType.TRIGGER, _minimal_rules())
     assert errors == []
+
+
+def test_lint_resource_reuses_validators_across_calls(tmp_path):
+    validators = {}
+    rules = _minimal_rules()
+    for name in ("PL_MES_ORDERS_INGEST", "bad_name"):
+        f = tmp_path / f"{name}.json"
+        f.write_text(json.dumps({"name": name, "properties": {"activities": []}}), encoding="utf-8")
+    errors_ok, _ = lint_resource(str(tmp_path / "PL_MES_ORDERS_INGEST.json"), ADFResourceType.PIPELINE, rules, validators)
+    validator = validators[ADFResourceType.PIPELINE]
+    errors_bad, _ = lint_resource(str(tmp_path / "bad_name.json"), ADFResourceType.PIPELINE, rules, validators)
+    assert validators == {ADFResourceType.PIPELINE: validator}
+    assert errors_ok == []
+    assert len(errors_bad) > 0
+
+
+# ---------------------------------------------------------------------------
+# lint_resources – batch entry point
+# ---------------------------------------------------------------------------
+
+def test_lint_resources_yields_results_in_input_order(tmp_path):
+    resources = {
+        "bad_name": {"name": "bad_name", "type": "Microsoft.DataFactory/factories/pipelines"},
+        "DS_ADLS_ORDERS_CSV": {"name": "DS_ADLS_ORDERS_CSV", "type": "Microsoft.DataFactory/factories/datasets"},
+        "mystery": {"name": "mystery", "properties": {}},
+        "broken": None,
+        "PL_MES_ORDERS_INGEST": {"name": "PL_MES_ORDERS_INGEST", "type": "Microsoft.DataFactory/factories/pipelines"},
+    }
+    paths = []
+    for name, resource in resources.items():
+        f = tmp_path / f"{name}.json"
+        f.write_text(json.dumps(resource) if resource else "{not valid json", encoding="utf-8")
+        paths.append(str(f))
+
+    results = list(lint_resources(paths, _minimal_rules()))
+
+    assert [r[0] for r in results] == paths
+    assert [r[1] for r in results] == [
+        ADFResourceType.PIPELINE,
+        ADFResourceType.DATASET,
+        ADFResourceType.UNKNOWN,
+        None,
+        ADFResourceType.PIPELINE,
+    ]
+    assert len(results[0][2]) > 0
+    assert results[1][2] == [] and results[2][2] == [] and results[4][2] == []
+    # A malformed file is reported in place and doesn't end the batch
+    assert [r[4] is not None for r in results] == [False, False, False, True, False]
@@ -9,6 +9,9 @@ from factorylint.core.validators import (
     DatasetValidator,
     LinkedServiceValidator,
     TriggerValidator,
+    _match_prefix,
+    _prefix_index,
+    _token_set,
 )
 
 
@@ -216,6 +219,29 @@ class TestPipelineValidator:
         errors, _ = PipelineValidator(rules).validate(path)
         assert any("Parameter" in e for e in errors)
 
+    def test_repeated_parameter_name_reported_for_every_pipeline(self, tmp_path):
+        rules = _pipeline_rules()
+        rules["parameters"] = {
+            "enabled": True,
+            "naming": {"prefix": "p_", "case": "lower", "pattern": "^p_[a-z0-9_]+$"},
+        }
+        validator = PipelineValidator(rules)
+        results = []
+        for i in range(2):
+            resource = {
+                "name": "PL_MES_ORDERS_INGEST",
+                "properties": {
+                    "activities": [],
+                    "parameters": {"BadParam": {"type": "string"}},
+                },
+            }
+            path = _write(tmp_path, f"bad_param_{i}.json", resource)
+            errors, _ = validator.validate(path)
+            errors.append("mutated by caller")
+            results.append(errors)
+        assert results[0] == results[1]
+        assert sum("Parameter 'BadParam'" in e for e in results[1]) == 3
+
     def test_invalid_variable_name(self, tmp_path):
         resource = {
             "name": "PL_MES_ORDERS_INGEST",
@@ -233,6 +259,18 @@ class TestPipelineValidator:
         errors, _ = PipelineValidator(rules).validate(path)
         assert any("Variable" in e for e in errors)
 
+    def test_preparsed_resource_is_not_read_from_disk(self, tmp_path):
+        resource = {"name": "bad_name", "properties": {"activities": []}}
+        missing = str(tmp_path / "does_not_exist.json")
+        errors, _ = PipelineValidator(_pipeline_rules()).validate(missing, resource)
+        assert any("prefix" in e for e in errors)
+
+    def test_yaml_resource_is_loaded(self, tmp_path):
+        p = tmp_path / "PL_MES_ORDERS_INGEST.yml"
+        p.write_text("name: PL_MES_ORDERS_INGEST\nproperties:\n  activities: []\n", encoding="utf-8")
+        errors, _ = PipelineValidator(_pipeline_rules()).validate(str(p))
+        assert errors == []
+
 
 # ============================================================
 # DatasetValidator
@@ -314,6 +352,27 @@ class TestDatasetValidator:
         errors, _ = DatasetValidator(rules).validate(path)
         assert errors == []
 
+    def test_null_allowed_source_abbreviations_skips_check(self, tmp_path):
+        resource = {"name": "DS_ANY_ORDERS_CSV", "properties": {}}
+        path = _write(tmp_path, "null_sources.json", resource)
+        rules = _dataset_rules(allowed_source_abbreviations=None)
+        errors, _ = DatasetValidator(rules).validate(path)
+        assert errors == []
+
+    def test_unhashable_allowed_formats_reports_lint_error(self, tmp_path):
+        resource = {"name": "DS_ADLS_ORDERS_CSV", "properties": {}}
+        path = _write(tmp_path, "unhashable_formats.json", resource)
+        rules = _dataset_rules(allowed_formats=[["CSV"], "PARQUET"])
+        errors, _ = DatasetValidator(rules).validate(path)
+        assert any("format" in e for e in errors)
+
+    def test_disabled_validator_ignores_invalid_naming_config(self, tmp_path):
+        resource = {"name": "INVALID_NAME", "properties": {}}
+        path = _write(tmp_path, "disabled.json", resource)
+        rules = _dataset_rules(pattern="(", allowed_source_abbreviations=["ADLS"])
+        rules["resources"]["datasets"]["enabled"] = False
+        assert DatasetValidator(rules).validate(path) == ([], [])
+
     def test_invalid_parameter_name(self, tmp_path):
         resource = {
             "name": "DS_ADLS_ORDERS_CSV",
@@ -385,6 +444,13 @@ class TestLinkedServiceValidator:
         errors, _ = LinkedServiceValidator(rules).validate(path)
         assert not any("abbreviation" in e for e in errors)
 
+    def test_null_allowed_abbreviations_skips_check(self, tmp_path):
+        resource = {"name": "LS_ANY_DATALAKE", "properties": {}}
+        path = _write(tmp_path, "null_abbr.json", resource)
+        rules = _linked_service_rules(allowed_abbreviations=None)
+        errors, _ = LinkedServiceValidator(rules).validate(path)
+        assert errors == []
+
     def test_disabled_validator_returns_empty(self, tmp_path):
         resource = {"name": "INVALID_NAME", "properties": {}}
         path = _write(tmp_path, "disabled.json", resource)
@@ -467,6 +533,13 @@ class TestTriggerValidator:
         errors, _ = TriggerValidator(rules).validate(path)
         assert not any("frequency" in e for e in errors)
 
+    def test_null_allowed_types_and_frequencies_skip_checks(self, tmp_path):
+        resource = {"name": "TR_ANYTYPE_ANYFREQ_IOT", "properties": {}}
+        path = _write(tmp_path, "null_tokens.json", resource)
+        rules = _trigger_rules(allowed_types=None, allowed_frequencies=None)
+        errors, _ = TriggerValidator(rules).validate(path)
+        assert errors == []
+
     def test_disabled_validator_returns_empty(self, tmp_path):
         resource = {"name": "INVALID_NAME", "properties": {}}
         path = _write(tmp_path, "disabled.json", resource)
@@ -603,6 +676,24 @@ class TestAnnotationValidation:
         errors, _ = PipelineValidator(_pipeline_rules_with_annotations()).validate(path)
         assert any("Unknown annotation" in e for e in errors)
 
+    def test_overlapping_prefixes_match_most_specific_category(self, tmp_path):
+        rules = _pipeline_rules_with_annotations()
+        rules["annotations"]["categories"]["subdomain"] = {
+            "prefix": "domain:sub:",
+            "required": False,
+            "allowed_values": ["domain:sub:payroll"],
+        }
+        resource = {
+            "name": "PL_MES_ORDERS_INGEST",
+            "properties": {
+                "activities": [],
+                "annotations": ["domain:finance", "domain:sub:payroll"],
+            },
+        }
+        path = _write(tmp_path, "overlap_ann.json", resource)
+        errors, _ = PipelineValidator(rules).validate(path)
+        assert errors == []
+
     def test_annotations_disabled_skips_validation(self, tmp_path):
         rules = _pipeline_rules_with_annotations()
         rules["annotations"]["enabled"] = False
@@ -616,3 +707,33 @@ class TestAnnotationValidation:
         path = _write(tmp_path, "disabled_ann.json", resource)
         errors, _ = PipelineValidator(rules).validate(path)
         assert errors == []
+
+
+# ============================================================
+# Prefix matching helper
+# ============================================================
+
+def test_match_prefix_returns_longest_configured_prefix():
+    index = _prefix_index(("env:", "env:prod:", "owner:") + tuple(f"cat{i}:" for i in range(500)))
+    assert _match_prefix("env:prod:eu", index) == "env:prod:"
+    assert _match_prefix("env:dev", index) == "env:"
+    assert _match_prefix("cat499:x", index) == "cat499:"
+    assert _match_prefix("en", index) is None
+    assert _match_prefix("unknown:x", index) is None
+
+
+# ============================================================
+# Token set helper
+# ============================================================
+
+def test_token_set_treats_none_as_empty():
+    assert _token_set(None) == frozenset()
+    assert _token_set(["CSV", "PARQUET"]) == {"CSV", "PARQUET"}
+
+
+@pytest.mark.parametrize("allowed_formats", [None, []])
+def test_empty_token_config_skips_check(tmp_path, allowed_formats):
+    resource = {"name": "DS_ADLS_ORDERS_ANYTHING", "properties": {}}
+    path = _write(tmp_path, "DS_ADLS_ORDERS_ANYTHING.json", resource)
+    errors, _ = DatasetValidator(_dataset_rules(allowed_formats=allowed_formats)).validate(path)
+    assert errors == []